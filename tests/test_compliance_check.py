@@ -0,0 +1,252 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import compliance_check
+
+
+def test_scan_reports_known_finding(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    source = source_dir / "bad.py"
+    source.write_text("import os\nos.system('x')\n")
+
+    issues = compliance_check.scan_files([str(source)], jobs=1)
+
+    assert any(issue.test_id == "B605" and issue.lineno == 2 for issue in issues)
+
+    report = tmp_path / "report.csv"
+    compliance_check.save_compliance_report(issues, str(report))
+    assert "bad.py,2," in report.read_text()
+
+
+def test_http_cache_is_created_lazily_under_cache_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(compliance_check, "_cache_path", tmp_path)
+    monkeypatch.setattr(compliance_check, "_session", None)
+
+    session = compliance_check._get_session()
+
+    assert compliance_check._get_session() is session
+    assert (tmp_path / "http_cache.sqlite").exists()
+
+
+class _FakeResponse:
+    def __init__(self, headers=None, from_cache=False):
+        self.headers = headers or {}
+        self.from_cache = from_cache
+
+
+def _rate_limit_headers(remaining, reset_ts):
+    return {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset_ts)}
+
+
+def test_limiter_blocks_until_reset_when_budget_is_spent():
+    limiter = compliance_check.GhLimiter()
+    limiter.acquire()
+    limiter.release(_FakeResponse(_rate_limit_headers(0, time.time() + 1)))
+
+    start = time.time()
+    limiter.acquire()
+
+    assert time.time() - start >= 0.9
+    assert limiter.remaining is None  # Budget unknown again after the reset
+
+
+def test_limiter_waits_for_in_flight_tokens():
+    limiter = compliance_check.GhLimiter()
+    limiter.acquire()
+    limiter.release(_FakeResponse(_rate_limit_headers(1, time.time() + 60)))
+    limiter.acquire()
+
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    waiter.start()
+    assert not acquired.wait(0.2)
+
+    limiter.release(_FakeResponse(_rate_limit_headers(1, time.time() + 60)))
+    assert acquired.wait(1)
+    waiter.join()
+
+
+def test_limiter_counts_requests_without_rate_limit_headers():
+    limiter = compliance_check.GhLimiter()
+    limiter.acquire()
+    limiter.release(_FakeResponse(_rate_limit_headers(5, time.time() + 60)))
+
+    limiter.acquire()
+    limiter.release(_FakeResponse())
+    limiter.acquire()
+    limiter.release(None)
+
+    assert limiter.remaining == 3
+
+
+def test_limiter_ignores_cached_responses():
+    limiter = compliance_check.GhLimiter()
+    limiter.acquire()
+    limiter.release(_FakeResponse(_rate_limit_headers(5, time.time() + 60)))
+
+    limiter.acquire()
+    limiter.release(_FakeResponse(_rate_limit_headers(4999, time.time() + 60), from_cache=True))
+
+    assert limiter.remaining == 5
+
+
+def test_truncated_tree_is_expanded_level_by_level(monkeypatch):
+    trees = {
+        "HEAD": ([{"path": "a.py", "type": "blob", "sha": "1"},
+                  {"path": "pkg", "type": "tree", "sha": "pkg"}], True),
+        "pkg": ([{"path": "b.txt", "type": "blob", "sha": "2"},
+                 {"path": "sub", "type": "tree", "sha": "sub"}], True),
+        "sub": ([{"path": "c.py", "type": "blob", "sha": "3"},
+                 {"path": "d", "type": "tree", "sha": "d"},
+                 {"path": "d/e.py", "type": "blob", "sha": "4"}], False),
+    }
+    monkeypatch.setattr(compliance_check, "_fetch_tree", lambda owner, repo, sha: trees[sha])
+
+    files = sorted(compliance_check.list_repo_files_trees_api("owner", "repo"))
+
+    raw = "https://raw.githubusercontent.com/owner/repo/HEAD/"
+    assert files == [
+        ("a.py", raw + "a.py"),
+        ("pkg/sub/c.py", raw + "pkg/sub/c.py"),
+        ("pkg/sub/d/e.py", raw + "pkg/sub/d/e.py"),
+    ]
+
+
+def test_fetch_tree_graphql_flattens_nested_entries(monkeypatch):
+    payload = {"data": {"repository": {"object": {"entries": [
+        {"name": "a.py", "type": "blob", "oid": "1"},
+        {"name": "README.md", "type": "blob", "oid": "2"},
+        {"name": "pkg", "type": "tree", "oid": "3", "object": {"entries": [
+            {"name": "b.py", "type": "blob", "oid": "4"},
+            # At the depth limit: no object, so it is listed with the trees API.
+            {"name": "deep", "type": "tree", "oid": "5"},
+        ]}},
+    ]}}}}
+
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return payload
+
+    class FakeSession:
+        def post(self, url, **kwargs):
+            assert url == compliance_check.GRAPHQL_URL
+            assert kwargs["json"]["variables"]["expression"] == "HEAD:"
+            return FakeResponse()
+
+    def fake_list_tree(owner, repo, ref, tree_sha, prefix=""):
+        assert (tree_sha, prefix) == ("5", "pkg/deep/")
+        yield prefix + "c.py", "listed-by-trees-api"
+
+    monkeypatch.setattr(compliance_check, "_get_session", FakeSession)
+    monkeypatch.setattr(compliance_check, "_list_tree", fake_list_tree)
+
+    files = list(compliance_check.fetch_tree_graphql("owner", "repo", "HEAD", "token"))
+
+    raw = "https://raw.githubusercontent.com/owner/repo/HEAD/"
+    assert files == [
+        ("a.py", raw + "a.py"),
+        ("pkg/b.py", raw + "pkg/b.py"),
+        ("pkg/deep/c.py", "listed-by-trees-api"),
+    ]
+
+
+def test_download_files_cached_reuses_archive_for_same_sha(tmp_path, monkeypatch):
+    downloads = []
+
+    def fake_download_files(owner, repo, local_dir, ref="HEAD", workers=1):
+        downloads.append(ref)
+        file_name = os.path.join(local_dir, "pkg", "a.py")
+        os.makedirs(os.path.dirname(file_name))
+        with open(file_name, "w") as f:
+            f.write("print('a')\n")
+        return [file_name]
+
+    monkeypatch.setattr(compliance_check, "_cache_path", tmp_path / "cache")
+    monkeypatch.setattr(compliance_check, "get_head_sha", lambda owner, repo: "abc123")
+    monkeypatch.setattr(compliance_check, "download_files", fake_download_files)
+
+    first = compliance_check.download_files_cached("owner", "repo", str(tmp_path / "first"))
+    second = compliance_check.download_files_cached("owner", "repo", str(tmp_path / "second"))
+
+    assert downloads == ["abc123"]
+    assert (tmp_path / "cache" / "owner_repo_abc123.tar.gz").exists()
+    assert second == [str(tmp_path / "second" / "pkg" / "a.py")]
+    assert open(second[0]).read() == open(first[0]).read()
+
+
+def test_evict_cache_removes_least_recently_used_archives(tmp_path, monkeypatch):
+    monkeypatch.setattr(compliance_check, "_cache_path", tmp_path)
+    monkeypatch.setattr(compliance_check, "CACHE_MAX_BYTES", 250)
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        archive = tmp_path / f"{name}.tar.gz"
+        archive.write_bytes(b"x" * 100)
+        mtime = 1_000_000 - age * 100
+        os.utime(archive, (mtime, mtime))
+
+    compliance_check._evict_cache()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["middle.tar.gz", "newest.tar.gz"]
+
+
+def _fake_listing(count, error=None):
+    def list_repo_files(owner, repo, ref):
+        for i in range(count):
+            yield f"pkg{i % 3}/mod{i}.py", f"https://example.invalid/{i}"
+        if error is not None:
+            raise error
+    return list_repo_files
+
+
+def _fake_download(downloaded, failing_url=None):
+    def download_one(download_url, file_name):
+        if download_url == failing_url:
+            raise RuntimeError("download failed")
+        with open(file_name, "w") as f:
+            f.write(download_url)
+        downloaded.append(file_name)
+    return download_one
+
+
+def test_download_files_downloads_every_listed_file(tmp_path, monkeypatch):
+    downloaded = []
+    monkeypatch.setattr(compliance_check, "list_repo_files", _fake_listing(200))
+    monkeypatch.setattr(compliance_check, "_download_one", _fake_download(downloaded))
+
+    file_names = compliance_check.download_files("owner", "repo", str(tmp_path), workers=4)
+
+    assert len(file_names) == 200
+    assert sorted(downloaded) == sorted(file_names)
+
+
+def test_download_files_reraises_download_error(tmp_path, monkeypatch):
+    # More files than the queue holds, so the producer relies on draining.
+    monkeypatch.setattr(compliance_check, "list_repo_files", _fake_listing(200))
+    monkeypatch.setattr(compliance_check, "_download_one",
+                        _fake_download([], failing_url="https://example.invalid/10"))
+
+    with pytest.raises(RuntimeError, match="download failed"):
+        compliance_check.download_files("owner", "repo", str(tmp_path), workers=4)
+
+
+def test_download_files_reraises_listing_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(compliance_check, "list_repo_files",
+                        _fake_listing(5, error=AssertionError("listing failed")))
+    monkeypatch.setattr(compliance_check, "_download_one", _fake_download([]))
+
+    with pytest.raises(AssertionError, match="listing failed"):
+        compliance_check.download_files("owner", "repo", str(tmp_path), workers=4)
+
+
+def test_download_files_rejects_zero_workers(tmp_path):
+    with pytest.raises(ValueError):
+        compliance_check.download_files("owner", "repo", str(tmp_path), workers=0)